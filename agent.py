@@ -3,7 +3,7 @@ from azure.identity import DefaultAzureCredential
 from azure.ai.projects.models import FunctionTool, ToolSet, BingGroundingTool
 import traceback
 import config
-import asyncio
+import functools
 
 from dotenv import set_key
 import os
@@ -15,67 +15,91 @@ config.az_application_insights_key = az_application_insights_key
 
 import logging
 from logging_config import configure_logging
-from client import ServerConnection
 
 # Configure logging - this will set up all loggers to use Azure Application Insights
 configure_logging()
 
+from client import execute_pooled_tool, run_coroutine_sync
+from mcp_tools import fetch_mcp_tools, get_mcp_server_url
+
 # Get logger for this module - already configured by configure_logging()
 logger = logging.getLogger(__name__)
 
+# The project client and toolset are invariant within a process, so they are
+# built once and reused by every create_agent/delete_agent call
+_project_client = None
+_TOOLSET = None
 
-def create_agent():
-    mcp_server_url = config.mcp_server_url
-    agent_name = config.az_assistant_name
-    agent_id = config.az_assistant_id
-    bing_connection_name = config.bing_connection_name
-
-    # Fetch tool schemas
-    async def fetch_tools():
-        conn = ServerConnection(mcp_server_url)
-        await conn.connect()
-        tools = await conn.list_tools()
-        await conn.cleanup()
-        return tools
 
-    tools = asyncio.run(fetch_tools())
+@functools.lru_cache(maxsize=1)
+def _cached_tool_schemas():
+    """Fetch the MCP tool schemas of all configured servers once per process."""
+    return fetch_mcp_tools()
 
-    # Build a function for each tool
-    def make_tool_func(tool_name):
-        def tool_func(**kwargs):
-            async def call_tool():
-                conn = ServerConnection(mcp_server_url)
-                await conn.connect()
-                result = await conn.execute_tool(tool_name, kwargs)
-                await conn.cleanup()
-                return result
 
-            return asyncio.run(call_tool())
+def _make_tool_func(tool_name):
+    """Build the Python callable registered with FunctionTool for an MCP tool."""
+    def tool_func(**kwargs):
+        # The pooled MCP connection lives on the client's background loop; this
+        # blocks the calling thread until the tool call completes
+        return run_coroutine_sync(
+            execute_pooled_tool(get_mcp_server_url(tool_name), tool_name, kwargs)
+        )
 
-        tool_func.__name__ = tool_name
-        return tool_func
+    tool_func.__name__ = tool_name
+    return tool_func
 
-    functions_dict = {tool["name"]: make_tool_func(tool["name"]) for tool in tools}
 
-    mcp_function_tool = FunctionTool(functions=list(functions_dict.values()))
+def _get_project_client():
+    """Return the process-wide AIProjectClient, creating it on first use."""
+    global _project_client
+    if _project_client is None:
+        _project_client = AIProjectClient.from_connection_string(
+            credential=DefaultAzureCredential(),
+            conn_str=config.az_agentic_ai_service_connection_string,
+        )
+    return _project_client
 
-    project_client = AIProjectClient.from_connection_string(
-        credential=DefaultAzureCredential(),
-        conn_str=config.az_agentic_ai_service_connection_string,
-    )
 
-    bing_connection = project_client.connections.get(
+@functools.lru_cache(maxsize=None)
+def _get_bing_connection_id(bing_connection_name):
+    """Look up the Bing connection id once per connection name."""
+    bing_connection = _get_project_client().connections.get(
         connection_name=bing_connection_name
     )
     conn_id = bing_connection.id
     print(conn_id)
+    return conn_id
+
 
-    # Initialize agent bing tool and add the connection id
-    bing = BingGroundingTool(connection_id=conn_id)
+def _build_toolset():
+    """Return the MCP + Bing toolset, building it once per process."""
+    global _TOOLSET
+    if _TOOLSET is None:
+        # Fetch tool schemas and build a function for each tool
+        tools = _cached_tool_schemas()
+        functions_dict = {tool["name"]: _make_tool_func(tool["name"]) for tool in tools}
 
-    toolset = ToolSet()
-    toolset.add(mcp_function_tool)
-    toolset.add(bing)
+        mcp_function_tool = FunctionTool(functions=list(functions_dict.values()))
+
+        # Initialize agent bing tool and add the connection id
+        bing = BingGroundingTool(
+            connection_id=_get_bing_connection_id(config.bing_connection_name)
+        )
+
+        toolset = ToolSet()
+        toolset.add(mcp_function_tool)
+        toolset.add(bing)
+        _TOOLSET = toolset
+    return _TOOLSET
+
+
+def create_agent():
+    agent_name = config.az_assistant_name
+    agent_id = config.az_assistant_id
+
+    project_client = _get_project_client()
+    toolset = _build_toolset()
 
     agent_instructions = """You are an AI Assistant tasked with helping users create news capsules of topics they ask for and store them for consumption. 
         
@@ -127,10 +151,7 @@ When a user asks about containers or blobs in storage, ALWAYS use the appropriat
 def delete_agent():
     # Delete the existing agent if it exists
     try:
-        project_client = AIProjectClient.from_connection_string(
-            credential=DefaultAzureCredential(),
-            conn_str=config.az_agentic_ai_service_connection_string,
-        )
+        project_client = _get_project_client()
 
         if hasattr(config, "az_assistant_id") and config.az_assistant_id:
             project_client.agents.delete_agent(config.az_assistant_id)
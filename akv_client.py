@@ -1,19 +1,51 @@
 import os
-from dotenv import load_dotenv
+import time
 from azure.keyvault.secrets import SecretClient
 from azure.identity import DefaultAzureCredential
 import logging
+from config import load_env
 
-load_dotenv()
+load_env()
 
 """ Azure Key Vault Configuration """
 print("initializing AKV to get secrets")
 key_vault_name = os.getenv("akv")
 
+# Seconds a secret fetched from Key Vault is served from the in-process cache
+secret_cache_ttl = float(os.getenv("AKV_SECRET_CACHE_TTL", "3600"))
+
+# Credential, SecretClient (keyed by vault URL) and secret values are shared
+# across calls so repeated lookups don't re-acquire AAD tokens
+_credential = None
+_client_cache = {}
+_secret_cache: dict[str, tuple[float, str]] = {}
+
+
+def _get_cached_secret(secret_name):
+    """Return the cached secret value if it hasn't expired, otherwise None."""
+    cached = _secret_cache.get(secret_name)
+    if cached is not None and time.monotonic() - cached[0] < secret_cache_ttl:
+        return cached[1]
+    return None
+
+
+def _get_secret_client(key_vault_url):
+    """Return the SecretClient for the vault, creating it (and the credential) once."""
+    global _credential
+    client = _client_cache.get(key_vault_url)
+    if client is None:
+        if _credential is None:
+            # DefaultAzureCredential supports managed identity
+            _credential = DefaultAzureCredential()
+        client = SecretClient(vault_url=key_vault_url, credential=_credential)
+        _client_cache[key_vault_url] = client
+    return client
+
 
 def get_secret_from_key_vault(secret_name):
     """
     Retrieves a secret from Azure Key Vault using Managed Identity.
+    Values are cached per process for `secret_cache_ttl` seconds.
     Falls back to environment variables if Key Vault access fails.
     
     Args:
@@ -23,21 +55,24 @@ def get_secret_from_key_vault(secret_name):
     Returns:
         The secret value or None if not found
     """
+    cached = _get_cached_secret(secret_name)
+    if cached is not None:
+        return cached
+
     try:
-        # Create a credential using DefaultAzureCredential which supports managed identity
-        credential = DefaultAzureCredential()
-        
         # Create the URL to your Key Vault
         key_vault_url = f"https://{key_vault_name}.vault.azure.net/"
         
-        # Create the client
-        client = SecretClient(vault_url=key_vault_url, credential=credential)
+        # Get the (cached) client
+        client = _get_secret_client(key_vault_url)
         
         # Get the secret
         secret = client.get_secret(secret_name)
+        _secret_cache[secret_name] = (time.monotonic(), secret.value)
         return secret.value
         
     except Exception as ex:
         logging.warning(f"Could not retrieve secret '{secret_name}' from Key Vault: {str(ex)}")
         # Fall back to environment variable if Key Vault access fails
-        return os.getenv(secret_name.replace('-', '_'))
\ No newline at end of file
+        return os.getenv(secret_name.replace('-', '_'))
+
@@ -1,11 +1,14 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import errno
 import os
+import socket
 import sys
 import traceback
 from datetime import datetime
 
+import aiohttp
 from aiohttp import web
 from aiohttp.web import Request, Response, json_response
 from botbuilder.core import (
@@ -27,10 +30,6 @@ az_application_insights_key = get_secret_from_key_vault(
 )
 config.az_application_insights_key = az_application_insights_key
 
-from botbuilder.core import MemoryStorage
-from bots.state_management_bot import StateManagementBot
-
-
 import logging
 from logging_config import configure_logging
 
@@ -38,6 +37,10 @@ from logging_config import configure_logging
 # This will set up all loggers to use Azure Application Insights
 configure_logging()
 
+from botbuilder.core import MemoryStorage
+from bots.state_management_bot import StateManagementBot
+from client import close_connections
+
 # Create adapter.
 # See https://aka.ms/about-bot-adapter to learn more about how bots work.
 SETTINGS = BotFrameworkAdapterSettings(config.APP_ID, config.APP_PASSWORD)
@@ -107,27 +110,77 @@ async def messages(req: Request) -> Response:
 
 
 
+# One pooled ClientSession is shared by all outbound HTTP from the app, so
+# TCP/TLS connections are reused across turns instead of re-established
+async def init_http_session(app: web.Application):
+    app["http_session"] = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=config.http_connection_limit,
+            keepalive_timeout=config.http_keepalive_timeout,
+        )
+    )
+
+
+async def close_http_session(app: web.Application):
+    await app["http_session"].close()
+
+
+# Create and dispose the bot's async Azure AI Project client with the app
+async def init_bot(app: web.Application):
+    await BOT.initialize(http_session=app["http_session"])
+
+
+async def close_bot(app: web.Application):
+    await BOT.close()
+
+
+# Close the pooled MCP server connections opened by the bot's tool calls
+async def close_mcp_connections(app: web.Application):
+    await close_connections()
+
+
 APP = web.Application(middlewares=[aiohttp_error_middleware])
 APP.router.add_post("/api/messages", messages)
+APP.on_startup.append(init_http_session)
+APP.on_startup.append(init_bot)
+APP.on_cleanup.append(close_bot)
+APP.on_cleanup.append(close_mcp_connections)
+APP.on_cleanup.append(close_http_session)
 
-if __name__ == "__main__":
-    port = config.PORT
-    max_retry = 3
+# Windows reports a port in use as WSAEADDRINUSE rather than EADDRINUSE
+ADDR_IN_USE_ERRNOS = (errno.EADDRINUSE, 10048)
+
+
+def bind_socket(host: str, port: int, max_retry: int = 3) -> socket.socket:
+    """
+    Bind a listening socket, moving to the next port while the port is in use.
+    Only the cheap bind is retried, so the app is started once.
+    """
     retry_count = 0
-    
-    while retry_count < max_retry:
+    while True:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # On Windows SO_REUSEADDR would allow binding a port that is in use
+        if os.name != "nt":
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
-            print(f"Server running at http://localhost:{port}")
-            web.run_app(APP, host="localhost", port=port)
-            break
+            sock.bind((host, port))
+            return sock
         except OSError as e:
-            if e.errno == 10048:  # Port already in use
-                retry_count += 1
+            sock.close()
+            retry_count += 1
+            if e.errno in ADDR_IN_USE_ERRNOS and retry_count < max_retry:
                 port += 1
                 print(f"Port {port-1} is in use. Trying port {port}...")
             else:
                 print(f"Error starting server: {e}")
-                raise e
-        except Exception as error:
-            print(f"Unexpected error: {error}")
-            raise error
+                raise
+
+
+if __name__ == "__main__":
+    sock = bind_socket("localhost", config.PORT)
+    print(f"Server running at http://localhost:{sock.getsockname()[1]}")
+    try:
+        web.run_app(APP, sock=sock)
+    except Exception as error:
+        print(f"Unexpected error: {error}")
+        raise error
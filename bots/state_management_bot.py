@@ -3,7 +3,8 @@ from botbuilder.core import ActivityHandler, ConversationState, TurnContext, Use
 
 from data_models.user_profile import UserProfile
 from data_models.conversation_data import ConversationData
-import time
+import asyncio
+import traceback
 from datetime import datetime
 from azure.ai.projects.models import (
     FunctionTool,
@@ -11,33 +12,62 @@ from azure.ai.projects.models import (
     SubmitToolOutputsAction,
     ToolOutput,
 )
-import time
 import logging
-import json
-from azure.ai.projects import AIProjectClient
-from azure.identity import DefaultAzureCredential
-from azure.ai.projects import AIProjectClient
-from azure.identity import DefaultAzureCredential
-from azure.ai.projects.models import FunctionTool
-from mcp_tools import create_mcp_functions, is_mcp_function
-from client import ServerConnection
+import orjson
+from azure.ai.projects.aio import AIProjectClient
+from azure.identity.aio import DefaultAzureCredential
+from azure.core.pipeline.transport import AioHttpTransport
+from mcp_tools import create_mcp_functions
 from mcp_direct import execute_mcp_tool_async
-import os
 import config
-# Use the centralized logging configuration
-from logging_config import configure_logging
 
+# Get logger for this module - configured by the application entry point
+logger = logging.getLogger(__name__)
 
-# Configure logging - this will set up all loggers to use Azure Application Insights
-configure_logging()
+# Local UTC offset, computed once instead of on every message
+_LOCAL_UTC_OFFSET = datetime.now().astimezone().utcoffset()
+
+# Run status polling backoff (seconds)
+RUN_POLL_INITIAL_DELAY = 0.25
+RUN_POLL_MAX_DELAY = 2.0
+RUN_POLL_BACKOFF = 1.5
+
+# Bounds concurrent tool calls across all turns so a large fan-out cannot
+# exhaust the MCP server's connections
+_MCP_SEM = asyncio.Semaphore(config.mcp_max_concurrency)
+
+
+async def _bounded(coro):
+    async with _MCP_SEM:
+        return await coro
+
+
+def _identity(arguments):
+    return arguments
+
+
+# Per-function argument normalizers, looked up once per tool call. Functions
+# without an entry receive their arguments unchanged.
+_ARG_NORMALIZERS = {}
+
+
+def _serialize(function_name, result):
+    """Convert a tool execution result (or the exception it raised) to a tool output."""
+    if isinstance(result, BaseException):
+        return orjson.dumps(
+            {"error": f"Failed to execute {function_name}: {str(result)}"}
+        ).decode()
+    return result
 
-# Get logger for this module - already configured by configure_logging()
-logger = logging.getLogger(__name__)
 
 # MCP tool functions
 mcp_functions = create_mcp_functions()
-logger.info(f"MCP functions created: {[func.__name__ for func in mcp_functions]}")
+logger.info("MCP functions created: %s", [func.__name__ for func in mcp_functions])
 functions = FunctionTool(functions=mcp_functions)
+# Logged once here rather than on every tool call
+logger.info("Available registered functions: %s", list(functions._functions))
+# MCP function names, for an O(1) membership check per tool call
+_MCP_NAMES = frozenset(func.__name__ for func in mcp_functions)
         
 class StateManagementBot(ActivityHandler):
 
@@ -56,21 +86,60 @@ class StateManagementBot(ActivityHandler):
         self.conversation_state = conversation_state
         self.user_state = user_state
 
-        # Create Azure OpenAI client
+        # The async project client and agent are created in initialize()
+        self.credential = None
+        self.project_client = None
+        self.agent = None
+
+        self.conversation_data_accessor = self.conversation_state.create_property(
+            "ConversationData"
+        )
+        self.user_profile_accessor = self.user_state.create_property("UserProfile")
+
+    async def initialize(self, http_session=None):
+        """
+        Create the async Azure AI Project client and retrieve the agent.
+
+        Args:
+            http_session: Optional aiohttp.ClientSession shared with the rest of
+                the app. The client uses it without taking ownership.
+        """
+        if self.project_client is not None:
+            return
+
+        client_kwargs = {}
+        if http_session is not None:
+            client_kwargs["transport"] = AioHttpTransport(
+                session=http_session, session_owner=False
+            )
+
+        self.credential = DefaultAzureCredential()
         self.project_client = AIProjectClient.from_connection_string(
-            credential=DefaultAzureCredential(),
+            credential=self.credential,
             conn_str=config.az_agentic_ai_service_connection_string,
+            **client_kwargs,
         )
 
-        
         # retrieve the agent already created
-        self.agent = self.project_client.agents.get_agent(config.az_assistant_id)
+        self.agent = await self.project_client.agents.get_agent(config.az_assistant_id)
         print("retrieved agent with id ", self.agent.id)
 
-        self.conversation_data_accessor = self.conversation_state.create_property(
-            "ConversationData"
-        )
-        self.user_profile_accessor = self.user_state.create_property("UserProfile")
+    async def close(self):
+        """Close the async Azure AI Project client and its credential."""
+        if self.project_client is not None:
+            await self.project_client.close()
+            self.project_client = None
+            self.agent = None
+        if self.credential is not None:
+            await self.credential.close()
+            self.credential = None
+
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
 
     async def on_message_activity(self, turn_context: TurnContext):
 
@@ -113,31 +182,38 @@ class StateManagementBot(ActivityHandler):
 
             if l_thread is None:
                 # Create a thread
-                conversation_data.thread = self.project_client.agents.create_thread()
+                conversation_data.thread = await self.project_client.agents.create_thread()
                 l_thread = conversation_data.thread
                 # Threads have an id as well
                 print("creating a new session and thread for this user!")
                 print("Created thread bearing Thread id: ", conversation_data.thread.id)
 
             # Create message to thread
-            message = self.project_client.agents.create_message(
-                thread_id=l_thread.id, role="user", content=turn_context.activity.text
+            message = await self.project_client.agents.create_message(
+                thread_id=l_thread.id,
+                role="user",
+                content=turn_context.activity.text,
             )
             print(f"Created message, ID: {message.id}")
 
             # Create a run to process the message
-            run = self.project_client.agents.create_run(
-                thread_id=l_thread.id, agent_id=self.agent.id
+            run = await self.project_client.agents.create_run(
+                thread_id=l_thread.id,
+                agent_id=self.agent.id,
             )
             print(f"Created thread run, ID: {run.id}")
             
             print("***** the run status is: *******", run.status)
 
-            # Monitor the run status
+            # Monitor the run status without blocking the event loop, backing off
+            # between polls so short runs return quickly and long runs poll less
+            poll_delay = RUN_POLL_INITIAL_DELAY
             while run.status in ["queued", "in_progress", "requires_action"]:
-                time.sleep(1)
-                run = self.project_client.agents.get_run(
-                    thread_id=l_thread.id, run_id=run.id
+                await asyncio.sleep(poll_delay)
+                poll_delay = min(RUN_POLL_MAX_DELAY, poll_delay * RUN_POLL_BACKOFF)
+                run = await self.project_client.agents.get_run(
+                    thread_id=l_thread.id,
+                    run_id=run.id,
                 )
 
                 # Handle function calling if required
@@ -149,104 +225,127 @@ class StateManagementBot(ActivityHandler):
                     
                     if not tool_calls:
                         print("No tool calls provided - cancelling run")
-                        self.project_client.agents.cancel_run(
-                            thread_id=l_thread.id, run_id=run.id
+                        await self.project_client.agents.cancel_run(
+                            thread_id=l_thread.id,
+                            run_id=run.id,
                         )
                         break
                     
-                    # Process each tool call
-                    tool_outputs = []
-                    for tool_call in tool_calls:
-                        if isinstance(tool_call, RequiredFunctionToolCall):
-                            try:
-                                # Get function name and arguments
-                                function_name = tool_call.function.name
-                                args_json = tool_call.function.arguments
-                                arguments = json.loads(args_json) if args_json else {}
-                                
-                                logger.info(f"Executing tool call: {function_name} with args: {arguments}")
-                                
-                                # Debug all available functions in our FunctionTool
-                                available_funcs = []
-                                for func in functions._functions:
-                                    # print(f"Function name: {func}")
-                                    # available_funcs.append(func.__name__)
-                                    available_funcs.append(func)
-                                logger.info(f"Available registered functions: {available_funcs}")
-                                
-                                try:
-                                    logger.info(f"Attempting to execute {function_name} via FunctionTool")
-                                    matched_function = None
-                                    for func in mcp_functions:
-                                        try:
-                                            if hasattr(func, '__name__') and func.__name__ == function_name:
-                                                matched_function = func
-                                                break
-                                        except (AttributeError, TypeError):
-                                            # Skip this function if it doesn't have __name__ attribute
-                                            continue                                    
-                                    # Dynamic check if this is an MCP function by name
-                                    if is_mcp_function(function_name):
-                                        # Direct MCP execution using our specialized handler
-                                        logger.info(f"Using direct MCP handler for storage function: {function_name}")
-                                        
-                                            
-                                        # Use the specialized MCP executor that bypasses the Python callable
-                                        try:
-                                            # Use the async version since we're in an async context
-                                            output = await execute_mcp_tool_async(function_name, arguments)
-                                            logger.info(f"Direct MCP execution succeeded: {output}")
-                                        except Exception as direct_error:
-                                            logger.error(f"Direct MCP execution failed: {direct_error}")
-                                            logger.error(f"Error details: {traceback.format_exc()}")
-                                            output = json.dumps({"error": f"Failed to execute {function_name}: {str(direct_error)}"})
-                                    else:
-                                        # Use FunctionTool as fallback
-                                        output = functions.execute(tool_call)
-                                        
-                                    logger.info(f"Successfully executed {function_name}, output: {output}")
-                                except Exception as e:
-                                    import traceback
-                                    logger.error(f"Error executing {function_name}: {e}")
-                                    logger.error(f"Error details: {str(e)}")
-                                    logger.error(f"Arguments type: {type(arguments)}, value: {arguments}")
-                                    logger.error(f"Stack trace: {traceback.format_exc()}")
-                                
-                                # Add result to tool outputs
-                                tool_outputs.append(
-                                    ToolOutput(
-                                        tool_call_id=tool_call.id,
-                                        output=output,
-                                    )
-                                )
-                                logger.info(f"Successfully executed {function_name}")
-                                
-                            except Exception as e:
-                                logger.error(f"Error executing tool_call {tool_call.id}: {e}")
-                                #logger.error(f"Stack trace: {traceback.format_exc()}")
+                    # Pass 1: parse the function tool calls
+                    parsed = [
+                        call
+                        for call in map(self._parse_tool_call, tool_calls)
+                        if call is not None
+                    ]
+
+                    # Pass 2: execute them concurrently, keeping their order
+                    results = await asyncio.gather(
+                        *(
+                            _bounded(self._dispatch(tool_call, function_name, arguments))
+                            for tool_call, function_name, arguments in parsed
+                        ),
+                        return_exceptions=True,
+                    )
+
+                    # Pass 3: package the results as tool outputs
+                    tool_outputs = [
+                        ToolOutput(
+                            tool_call_id=tool_call.id,
+                            output=_serialize(function_name, result),
+                        )
+                        for (tool_call, function_name, _), result in zip(parsed, results)
+                    ]
 
                     # Submit tool outputs back to the run
                     print(f"Submitting {len(tool_outputs)} tool outputs")
                     if tool_outputs:
-                        self.project_client.agents.submit_tool_outputs_to_run(
+                        await self.project_client.agents.submit_tool_outputs_to_run(
                             thread_id=l_thread.id,
                             run_id=run.id,
                             tool_outputs=tool_outputs,
                         )
+                        # Tool outputs were submitted, poll quickly again
+                        poll_delay = RUN_POLL_INITIAL_DELAY
 
                 print(f"Current run status: {run.status}")
 
-            # Fetch and log all messages
-            messages = self.project_client.agents.list_messages(thread_id=l_thread.id)
+            # Fetch only the latest message, which holds the run's reply
+            messages = await self.project_client.agents.list_messages(
+                thread_id=l_thread.id, limit=1, order="desc"
+            )
             assistant_response = ""
-            for message in messages["data"]:
-                if message["role"] == "assistant":
-                    if message.get("content") and len(message["content"]) > 0:
-                        assistant_response = message["content"][0]["text"]["value"]
-                        break
+            if messages["data"]:
+                message = messages["data"][0]
+                if message["role"] == "assistant" and message.get("content"):
+                    assistant_response = message["content"][0]["text"]["value"]
 
             return await turn_context.send_activity(assistant_response)
 
+    @staticmethod
+    def _parse_tool_call(tool_call):
+        """
+        Parse a tool call requested by the run.
+
+        Returns:
+            (tool_call, function_name, arguments), or None if it isn't a
+            function tool call or its arguments can't be parsed
+        """
+        if not isinstance(tool_call, RequiredFunctionToolCall):
+            return None
+        try:
+            # Get function name and arguments
+            function_name = tool_call.function.name
+            args_json = tool_call.function.arguments
+            arguments = orjson.loads(args_json) if args_json else {}
+            arguments = _ARG_NORMALIZERS.get(function_name, _identity)(arguments)
+        except Exception as e:
+            logger.error("Error executing tool_call %s: %s", tool_call.id, e)
+            return None
+
+        logger.info("Executing tool call: %s with args: %s", function_name, arguments)
+        return tool_call, function_name, arguments
+
+    async def _dispatch(self, tool_call, function_name, arguments):
+        """
+        Execute a parsed tool call.
+
+        Returns:
+            The tool output string
+
+        Raises:
+            Exception: If the FunctionTool fallback fails
+        """
+        try:
+            logger.info("Attempting to execute %s via FunctionTool", function_name)
+            # Dynamic check if this is an MCP function by name
+            if function_name in _MCP_NAMES:
+                # Direct MCP execution using our specialized handler
+                logger.info("Using direct MCP handler for storage function: %s", function_name)
+
+                # Use the specialized MCP executor that bypasses the Python callable
+                try:
+                    # Use the async version since we're in an async context
+                    output = await execute_mcp_tool_async(function_name, arguments)
+                    logger.info("Direct MCP execution succeeded: %s", output)
+                except Exception as direct_error:
+                    logger.error("Direct MCP execution failed: %s", direct_error)
+                    # format_exc walks the frames, only pay for it when debugging
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Error details: %s", traceback.format_exc())
+                    output = _serialize(function_name, direct_error)
+            else:
+                # Use FunctionTool as fallback
+                output = functions.execute(tool_call)
+
+            logger.info("Successfully executed %s, output: %s", function_name, output)
+            return output
+        except Exception as e:
+            logger.error("Error executing %s: %s", function_name, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Arguments type: %s, value: %s", type(arguments), arguments)
+                logger.debug("Stack trace: %s", traceback.format_exc())
+            raise
+
     async def on_turn(self, turn_context: TurnContext):
         await super().on_turn(turn_context)
 
@@ -254,9 +353,5 @@ class StateManagementBot(ActivityHandler):
         await self.user_state.save_changes(turn_context)
 
     def __datetime_from_utc_to_local(self, utc_datetime):
-        now_timestamp = time.time()
-        offset = datetime.fromtimestamp(now_timestamp) - datetime.utcfromtimestamp(
-            now_timestamp
-        )
-        result = utc_datetime + offset
+        result = utc_datetime + _LOCAL_UTC_OFFSET
         return result.strftime("%I:%M:%S %p, %A, %B %d of %Y")
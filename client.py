@@ -6,43 +6,85 @@ and secure connection handling.
 """
 
 import asyncio
-import json
+import atexit
+import functools
 import logging
-import os
+import random
 import sys
+import threading
+import time
+import weakref
 from contextlib import AsyncExitStack
-from typing import Any, Dict, List, Optional, Tuple, Union
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, List, Optional, Tuple, TypeVar, Union
 
+import anyio
 import httpx
-from azure.identity import DefaultAzureCredential
-from azure.core.credentials import TokenCredential
-
-try:
-    # Python SDK Version 1.0.0 and above
-    from openai import AzureOpenAI
-except ImportError:
-    # Use older Azure OpenAI package if available
-    try:
-        from azure.ai.openai import AzureOpenAI
-    except ImportError:
-        raise ImportError(
-            "Neither the openai package (v1.0.0+) nor azure.ai.openai package is installed"
-        )
+import orjson
+
+# azure.identity pulls in msal/cryptography, so it is only imported when a
+# credential is actually requested
+if TYPE_CHECKING:
+    from azure.core.credentials import TokenCredential
 
-from dotenv import load_dotenv
 from mcp.client.session import ClientSession
 from mcp.client.sse import sse_client
 import config
 
-# Import the centralized logging configuration
-from logging_config import configure_logging
+# Get logger for this module - configured by the application entry point
+logger = logging.getLogger(__name__)
 
-# Configure logging - this will set up all loggers to use Azure Application Insights
-configure_logging()
+T = TypeVar("T")
 
-# Get logger for this module - already configured by configure_logging()
-logger = logging.getLogger(__name__)
+# Tool definitions per MCP server URL, shared by all connections to that server
+# as (fetched_at, tools, tool_names) and refreshed after
+# config.mcp_tools_cache_ttl seconds
+_TOOLS_CACHE: Dict[str, Tuple[float, List[Dict[str, Any]], frozenset]] = {}
+
+# Dedicated event loop, running in a daemon thread, for driving MCP coroutines
+# from synchronous code (e.g. FunctionTool callables) without asyncio.run()
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop, starting it on first use.
+
+    Returns:
+        The running background event loop
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="mcp-event-loop", daemon=True
+            ).start()
+            _background_loop = loop
+            atexit.register(_close_background_connections)
+    return _background_loop
+
+
+def run_coroutine_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the shared background loop and wait for its result.
+
+    Blocks the calling thread until the coroutine finishes, so it is only for
+    synchronous code. Don't call it from coroutines running on the app's
+    event loop (it would freeze that loop for the whole MCP round trip) or
+    on the background loop itself (deadlock). Async callers should instead
+    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+    coro, get_background_loop())).
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait for the result, or None to wait indefinitely
+
+    Returns:
+        The coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    return future.result(timeout)
 
 
 class Configuration:
@@ -50,22 +92,21 @@ class Configuration:
 
     def __init__(self) -> None:
         """Initialize configuration with environment variables."""
-        self.load_env()
-
-        # MCP Server URL - Read from environment variable with fallback
+        # MCP Server URL - resolved by config from the environment with fallback
         self.mcp_server_url = config.mcp_server_url
-        if not self.mcp_server_url:
-            self.mcp_server_url = "http://localhost:8000/sse"  # Only used as fallback
+        self.mcp_server_urls = config.mcp_server_urls
+        if self.mcp_server_url == config.DEFAULT_MCP_SERVER_URL:
             logger.warning(
-                f"MCP_SERVER_URL not found in environment, using default: {self.mcp_server_url}"
+                "MCP_SERVER_URL not found in environment, using default: %s",
+                self.mcp_server_url,
             )
         else:
-            logger.info(f"Using MCP server URL from environment: {self.mcp_server_url}")
+            logger.info("Using MCP server URL from environment: %s", self.mcp_server_url)
 
     @staticmethod
     def load_env() -> None:
-        """Load environment variables from .env file."""
-        load_dotenv()
+        """Load environment variables from .env file, if not loaded yet."""
+        config.load_env()
 
     @staticmethod
     def load_config(file_path: str) -> Dict[str, Any]:
@@ -83,50 +124,92 @@ class Configuration:
             JSONDecodeError: If configuration file is invalid JSON.
         """
         try:
-            with open(file_path, "r") as f:
-                return json.load(f)
+            with open(file_path, "rb") as f:
+                return orjson.loads(f.read())
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {file_path}")
+            logger.error("Configuration file not found: %s", file_path)
             raise
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in configuration file: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON in configuration file: %s", e)
             raise
 
-    @property
-    def azure_credential(self) -> TokenCredential:
+    @functools.cached_property
+    def azure_credential(self) -> "TokenCredential":
         """
-        Get Azure managed identity credential.
+        Get Azure managed identity credential. Created once per Configuration
+        so its token cache is reused.
 
         Returns:
             DefaultAzureCredential
         """
+        from azure.identity import DefaultAzureCredential
+
         try:
             return DefaultAzureCredential()
         except Exception as e:
-            logger.error(f"Error creating Azure credential: {e}")
+            logger.error("Error creating Azure credential: %s", e)
             raise ValueError(f"Failed to create Azure managed identity credential: {e}")
 
 
+def _is_unrecoverable(error: Exception) -> bool:
+    """
+    Check whether a tool execution error can't be fixed by retrying, e.g.
+    invalid arguments or an authentication/authorization failure.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in (401, 403)
+    return isinstance(error, (ValueError, TypeError, PermissionError))
+
+
 class ServerConnection:
     """
     Manages connection to an MCP server with proper resource lifecycle management.
     Implements robust error handling and timeout management.
     """
 
-    def __init__(self, server_url: str) -> None:
+    def __init__(
+        self,
+        server_url: str,
+        connect_timeout: Optional[float] = None,
+        sse_read_timeout: Optional[float] = None,
+    ) -> None:
         """
         Initialize the ServerConnection with the server URL.
 
         Args:
             server_url: The URL of the MCP server, e.g., http://localhost:8000/sse
+            connect_timeout: Timeout for the SSE transport's HTTP operations,
+                defaults to config.mcp_sse_timeout
+            sse_read_timeout: How long to wait for a new SSE event before
+                giving up, defaults to config.mcp_sse_read_timeout
         """
         self.server_url = server_url
+        self.connect_timeout = (
+            config.mcp_sse_timeout if connect_timeout is None else connect_timeout
+        )
+        self.sse_read_timeout = (
+            config.mcp_sse_read_timeout if sse_read_timeout is None else sse_read_timeout
+        )
         self.session: Optional[ClientSession] = None
         self._cleanup_lock = asyncio.Lock()
         self.exit_stack = AsyncExitStack()
-        self._tools_cache: Optional[List[Any]] = None
         self.connected = False
 
+    async def __aenter__(self) -> "ServerConnection":
+        """
+        Connect to the MCP server for the duration of an ``async with`` block.
+
+        Raises:
+            RuntimeError: If the connection could not be established
+        """
+        if not await self.connect():
+            raise RuntimeError(f"Could not connect to MCP server at {self.server_url}")
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the connection. The block owns it, so no lock is needed."""
+        await self._close()
+
     async def connect(self, timeout: float = 30.0) -> bool:
         """
         Connect to the MCP server with timeout.
@@ -138,17 +221,21 @@ class ServerConnection:
             True if connection succeeded, False otherwise
         """
         try:
-            # Create connection with timeout
-            connection_task = self._connect()
-            await asyncio.wait_for(connection_task, timeout=timeout)
+            # Create connection with timeout. asyncio.timeout keeps _connect in
+            # the calling task, which must also be the one that runs cleanup()
+            if hasattr(asyncio, "timeout"):
+                async with asyncio.timeout(timeout):
+                    await self._connect()
+            else:
+                await asyncio.wait_for(self._connect(), timeout=timeout)
             self.connected = True
             return True
         except asyncio.TimeoutError:
-            logger.error(f"Connection to {self.server_url} timed out after {timeout}s")
+            logger.error("Connection to %s timed out after %ss", self.server_url, timeout)
             await self.cleanup()
             return False
         except Exception as e:
-            logger.error(f"Failed to connect to {self.server_url}: {e}")
+            logger.error("Failed to connect to %s: %s", self.server_url, e)
             await self.cleanup()
             return False
 
@@ -159,7 +246,11 @@ class ServerConnection:
         try:
             # Connect to the server using SSE
             read_write = await self.exit_stack.enter_async_context(
-                sse_client(self.server_url)
+                sse_client(
+                    self.server_url,
+                    timeout=self.connect_timeout,
+                    sse_read_timeout=self.sse_read_timeout,
+                )
             )
             read_stream, write_stream = read_write
 
@@ -169,10 +260,11 @@ class ServerConnection:
             )
             await session.initialize()
             self.session = session
-            logger.info(f"Connected to MCP server at {self.server_url}")
+            logger.info("Connected to MCP server at %s", self.server_url)
 
         except Exception as e:
-            logger.error(f"Error connecting to MCP server: {e}")
+            logger.error("Error connecting to MCP server: %s", e)
+            _TOOLS_CACHE.pop(self.server_url, None)
             await self.cleanup()
             raise
 
@@ -189,18 +281,25 @@ class ServerConnection:
         if not self.session:
             raise RuntimeError("Not connected to MCP server")
 
-        if self._tools_cache is None:
-            tools_response = await self.session.list_tools()
-            self._tools_cache = [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": tool.inputSchema,
-                }
-                for tool in tools_response.tools
-            ]
-
-        return self._tools_cache
+        cached = _TOOLS_CACHE.get(self.server_url)
+        if cached is not None and time.monotonic() - cached[0] < config.mcp_tools_cache_ttl:
+            return cached[1]
+
+        tools_response = await self.session.list_tools()
+        tools = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.inputSchema,
+            }
+            for tool in tools_response.tools
+        ]
+        _TOOLS_CACHE[self.server_url] = (
+            time.monotonic(),
+            tools,
+            frozenset(tool["name"] for tool in tools),
+        )
+        return tools
 
     async def execute_tool(
         self,
@@ -208,6 +307,8 @@ class ServerConnection:
         arguments: Dict[str, Any],
         retries: int = 3,
         retry_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
     ) -> Dict[str, Any]:
         """
         Execute a tool on the MCP server with retry logic.
@@ -217,24 +318,32 @@ class ServerConnection:
             arguments: Arguments to pass to the tool
             retries: Number of retry attempts for transient failures
             retry_delay: Base delay between retries (will use exponential backoff)
+            max_delay: Upper bound for the backoff delay before jitter
+            jitter: Fraction by which each delay is randomly varied (+/-), so
+                concurrent clients don't retry in lockstep
 
         Returns:
             Tool execution result
 
         Raises:
             RuntimeError: If not connected to server
-            ValueError: If the tool doesn't exist
-            Exception: On tool execution failure after all retries
+            ValueError: If the tool isn't in the server's unexpired cached tool list
+            Exception: On tool execution failure after all retries, or at once
+                for unrecoverable errors
         """
         if not self.session:
             raise RuntimeError("Not connected to MCP server")
 
-        # Verify tool exists
-        tools = await self.list_tools()
-        if not any(tool["name"] == tool_name for tool in tools):
+        # Reject unknown tools early if a fresh tool list is cached, else
+        # leave it to the server rather than listing tools on every call
+        cached = _TOOLS_CACHE.get(self.server_url)
+        if (
+            cached is not None
+            and tool_name not in cached[2]
+            and time.monotonic() - cached[0] < config.mcp_tools_cache_ttl
+        ):
             raise ValueError(f"Tool '{tool_name}' not found on MCP server")
 
-
         # Implement retry with exponential backoff
         attempt = 0
         last_exception = None
@@ -242,30 +351,46 @@ class ServerConnection:
         while attempt <= retries:
             try:
                 logger.info(
-                    f"Executing tool '{tool_name}' (attempt {attempt + 1}/{retries + 1})..."
+                    "Executing tool '%s' (attempt %d/%d)...",
+                    tool_name, attempt + 1, retries + 1,
                 )
                 result = await self.session.call_tool(tool_name, arguments)
 
                 if result and result.content:
                     try:
-                        return json.loads(result.content[0].text)
-                    except json.JSONDecodeError:
+                        return orjson.loads(result.content[0].text)
+                    except orjson.JSONDecodeError:
                         return {"text": result.content[0].text}
                 else:
                     return {"error": "No content received from tool"}
 
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError) as e:
+                # The transport is gone, retrying on this session can't succeed
+                self.connected = False
+                _TOOLS_CACHE.pop(self.server_url, None)
+                raise ConnectionError(
+                    f"Connection to {self.server_url} was closed"
+                ) from e
+
             except Exception as e:
                 last_exception = e
                 attempt += 1
+                if _is_unrecoverable(e):
+                    logger.error("Tool execution failed with unrecoverable error: %s", e)
+                    raise Exception(
+                        f"Failed to execute tool '{tool_name}': {e}"
+                    ) from last_exception
                 if attempt <= retries:
-                    delay = retry_delay * (2 ** (attempt - 1))  # Exponential backoff
+                    # Capped exponential backoff with jitter
+                    delay = min(max_delay, retry_delay * (2 ** (attempt - 1)))
+                    delay *= 1 + random.uniform(-jitter, jitter)
                     logger.warning(
-                        f"Tool execution failed: {e}. Retrying in {delay:.1f}s..."
+                        "Tool execution failed: %s. Retrying in %.1fs...", e, delay
                     )
                     await asyncio.sleep(delay)
                 else:
                     logger.error(
-                        f"Tool execution failed after {retries + 1} attempts: {e}"
+                        "Tool execution failed after %d attempts: %s", retries + 1, e
                     )
                     raise Exception(
                         f"Failed to execute tool '{tool_name}': {e}"
@@ -276,15 +401,214 @@ class ServerConnection:
         Clean up all resources safely. Can be called multiple times.
         """
         async with self._cleanup_lock:
-            logger.debug("Cleaning up server connection resources")
-            try:
-                await self.exit_stack.aclose()
-                self.session = None
-                self._tools_cache = None
-                self.connected = False
-                logger.info("Server connection resources cleaned up")
-            except Exception as e:
-                logger.warning(f"Error during resource cleanup: {e}")
+            await self._close()
+
+    async def _close(self) -> None:
+        """Close the session and SSE transport."""
+        logger.debug("Cleaning up server connection resources")
+        self.connected = False
+        try:
+            await self.exit_stack.aclose()
+            self.session = None
+            logger.info("Server connection resources cleaned up")
+        except Exception as e:
+            logger.warning("Error during resource cleanup: %s", e)
+
+
+# Long-lived MCP connections, one per server URL and event loop (a connection's
+# streams are bound to the loop that opened it). Each pooled connection is
+# opened, held and closed by its own owner task, since the SSE transport
+# must be exited from the task that entered it.
+# Entries are (connection, closing event, owner task, ready future); ready
+# resolves once the owner task has connected, or failed to.
+_connection_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Tuple[ServerConnection, asyncio.Event, asyncio.Task, asyncio.Future]]]" = weakref.WeakKeyDictionary()
+
+
+async def _hold_connection(
+    conn: ServerConnection, ready: asyncio.Future, closing: asyncio.Event
+) -> None:
+    """
+    Owner task for a pooled connection: connect, wait until asked to close
+    (or until the transport fails), then clean up.
+    """
+    try:
+        async with conn:
+            ready.set_result(True)
+            await closing.wait()
+    except asyncio.CancelledError:
+        # The transport failed or the loop is shutting down
+        pass
+    except Exception as e:
+        # connect() has already logged the cause; waiters see ready=False
+        logger.debug("Pooled connection to %s ended: %s", conn.server_url, e)
+    finally:
+        if not ready.done():
+            ready.set_result(False)
+        pool = _connection_pools.get(asyncio.get_running_loop(), {})
+        entry = pool.get(conn.server_url)
+        if entry is not None and entry[0] is conn:
+            del pool[conn.server_url]
+
+
+async def get_or_create_connection(server_url: str) -> ServerConnection:
+    """
+    Get the pooled connection to an MCP server, connecting on first use.
+
+    Args:
+        server_url: The URL of the MCP server
+
+    Returns:
+        A connected ServerConnection shared with other callers on this loop
+
+    Raises:
+        RuntimeError: If the connection could not be established
+    """
+    loop = asyncio.get_running_loop()
+    pool = _connection_pools.setdefault(loop, {})
+
+    # Nothing below awaits until the pending entry is in the pool, so the
+    # check-and-insert is atomic on this loop. Connecting happens outside it:
+    # callers for the same URL share the pending ready future, and other URLs
+    # are never held up by a slow handshake.
+    entry = pool.get(server_url)
+    if entry is not None:
+        conn, closing, _, ready = entry
+        if conn.connected:
+            return conn
+        if ready.done():
+            # Let the owner task of the dropped connection clean it up
+            closing.set()
+            entry = None
+
+    if entry is None:
+        conn = ServerConnection(server_url)
+        ready = loop.create_future()
+        closing = asyncio.Event()
+        task = loop.create_task(_hold_connection(conn, ready, closing))
+        pool[server_url] = (conn, closing, task, ready)
+
+    # Shielded so a cancelled caller doesn't cancel the connect for the others
+    if not await asyncio.shield(ready):
+        raise RuntimeError(f"Could not connect to MCP server at {server_url}")
+    return conn
+
+
+async def execute_pooled_tool(
+    server_url: str, tool_name: str, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Execute a tool over the pooled connection to an MCP server, reconnecting
+    once if the pooled connection turns out to have been dropped.
+
+    Args:
+        server_url: The URL of the MCP server
+        tool_name: Name of the tool to execute
+        arguments: Arguments to pass to the tool
+
+    Returns:
+        Tool execution result
+    """
+    conn = await get_or_create_connection(server_url)
+    try:
+        return await conn.execute_tool(tool_name, arguments)
+    except ConnectionError as e:
+        logger.warning("%s, reconnecting", e)
+        conn = await get_or_create_connection(server_url)
+        return await conn.execute_tool(tool_name, arguments)
+
+
+async def close_connections() -> None:
+    """
+    Close every pooled connection opened on the running event loop.
+
+    The connections are independent, so all owner tasks are signalled at
+    once and their teardowns run concurrently.
+    """
+    pool = _connection_pools.pop(asyncio.get_running_loop(), {})
+    for _, closing, task, ready in pool.values():
+        closing.set()
+        if not ready.done():
+            # Don't wait out the connect timeout of a server still connecting
+            task.cancel()
+    tasks = {task for _, _, task, _ in pool.values()}
+    if tasks:
+        await asyncio.wait(tasks)
+
+
+def _close_background_connections() -> None:
+    """atexit hook closing the background loop's pooled connections."""
+    try:
+        run_coroutine_sync(close_connections(), timeout=10)
+    except Exception as e:
+        logger.warning("Error closing MCP connections: %s", e)
+
+
+class MCPHost:
+    """
+    Manages pooled connections to several MCP servers, connecting to and
+    listing tools from all of them concurrently.
+    """
+
+    def __init__(self, server_urls: List[str]) -> None:
+        """
+        Initialize the MCPHost with the server URLs.
+
+        Args:
+            server_urls: URLs of the MCP servers, e.g., http://localhost:8000/sse
+        """
+        self.server_urls = list(dict.fromkeys(server_urls))
+        self._conns: Dict[str, ServerConnection] = {}
+
+    async def connect_all(self) -> Dict[str, ServerConnection]:
+        """
+        Connect to every server concurrently. Servers that can't be reached
+        are logged and left out.
+
+        Returns:
+            Dict mapping server URL to its connection
+        """
+        results = await asyncio.gather(
+            *(get_or_create_connection(url) for url in self.server_urls),
+            return_exceptions=True,
+        )
+        self._conns = {}
+        for url, result in zip(self.server_urls, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to connect to MCP server %s: %s", url, result)
+            else:
+                self._conns[url] = result
+        return self._conns
+
+    async def list_all_tools(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List the tools of every connected server concurrently.
+
+        Returns:
+            Dict mapping server URL to its tool definitions
+        """
+        urls = list(self._conns)
+        results = await asyncio.gather(
+            *(self._conns[url].list_tools() for url in urls),
+            return_exceptions=True,
+        )
+        tools: Dict[str, List[Dict[str, Any]]] = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to list tools on MCP server %s: %s", url, result)
+            else:
+                tools[url] = result
+        return tools
+
+
+# JSON schema type -> (accepted Python types, description used in errors)
+_JSON_SCHEMA_TYPE_CHECKS: Dict[str, Tuple[Tuple[type, ...], str]] = {
+    "string": ((str,), "a string"),
+    "number": ((int, float), "a number"),
+    "integer": ((int,), "an integer"),
+    "boolean": ((bool,), "a boolean"),
+    "array": ((list,), "an array"),
+    "object": ((dict,), "an object"),
+}
 
 
 class Tool:
@@ -309,6 +633,16 @@ class Tool:
         self._required_params = input_schema.get("required", [])
         self._properties = input_schema.get("properties", {})
 
+        # Precomputed once so validate_arguments is a set difference plus one
+        # dict lookup per argument
+        self._required_set = frozenset(self._required_params)
+        self._type_checks: Dict[str, Tuple[Tuple[type, ...], str]] = {
+            param_name: _JSON_SCHEMA_TYPE_CHECKS[param_schema.get("type")]
+            for param_name, param_schema in self._properties.items()
+            if isinstance(param_schema.get("type"), str)
+            and param_schema.get("type") in _JSON_SCHEMA_TYPE_CHECKS
+        }
+
     @property
     def required_params(self) -> List[str]:
         """Get list of required parameters."""
@@ -332,31 +666,16 @@ class Tool:
             Tuple of (is_valid, error_message)
         """
         # Check required parameters
-        for param in self.required_params:
-            if param not in arguments:
-                return False, f"Required parameter '{param}' is missing"
+        missing = self._required_set - arguments.keys()
+        if missing:
+            param = next(p for p in self._required_params if p in missing)
+            return False, f"Required parameter '{param}' is missing"
 
         # Validate parameter types (basic validation only)
         for param_name, param_value in arguments.items():
-            if param_name in self._properties:
-                param_schema = self._properties[param_name]
-                param_type = param_schema.get("type")
-
-                # Very basic type checking
-                if param_type == "string" and not isinstance(param_value, str):
-                    return False, f"Parameter '{param_name}' should be a string"
-                elif param_type == "number" and not isinstance(
-                    param_value, (int, float)
-                ):
-                    return False, f"Parameter '{param_name}' should be a number"
-                elif param_type == "integer" and not isinstance(param_value, int):
-                    return False, f"Parameter '{param_name}' should be an integer"
-                elif param_type == "boolean" and not isinstance(param_value, bool):
-                    return False, f"Parameter '{param_name}' should be a boolean"
-                elif param_type == "array" and not isinstance(param_value, list):
-                    return False, f"Parameter '{param_name}' should be an array"
-                elif param_type == "object" and not isinstance(param_value, dict):
-                    return False, f"Parameter '{param_name}' should be an object"
+            type_check = self._type_checks.get(param_name)
+            if type_check is not None and not isinstance(param_value, type_check[0]):
+                return False, f"Parameter '{param_name}' should be {type_check[1]}"
 
         return True, None
 
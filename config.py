@@ -3,7 +3,19 @@
 # Licensed under the MIT License.
 import os
 from dotenv import load_dotenv
-load_dotenv()
+
+_env_loaded = False
+
+
+def load_env():
+    """Load environment variables from the .env file, once per process."""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+load_env()
 
 
 """ Bot Configuration """
@@ -20,5 +32,35 @@ az_assistant_name = os.getenv("AZ_ASSISTANT_NAME")
 bing_connection_name = os.getenv("BING_CONNECTION_NAME")
 aoai_model_name = os.getenv("aoai_model_name", "gpt-4o")
 
-# MCP Server URL with default value
-mcp_server_url = os.getenv("MCP_SERVER_URL", "http://localhost:8000/sse")
\ No newline at end of file
+# Application Insights log export: seconds between batched sends, records per
+# send, bound on the in-memory queue, and seconds allowed to flush on exit
+app_insights_export_interval = float(os.getenv("APP_INSIGHTS_EXPORT_INTERVAL", "5"))
+app_insights_max_batch_size = int(os.getenv("APP_INSIGHTS_MAX_BATCH_SIZE", "100"))
+app_insights_queue_capacity = int(os.getenv("APP_INSIGHTS_QUEUE_CAPACITY", "8192"))
+app_insights_grace_period = float(os.getenv("APP_INSIGHTS_GRACE_PERIOD", "5"))
+
+# MCP Server URL with default value, also used when the variable is empty
+DEFAULT_MCP_SERVER_URL = "http://localhost:8000/sse"
+mcp_server_url = os.getenv("MCP_SERVER_URL") or DEFAULT_MCP_SERVER_URL
+
+# All MCP servers to fetch tools from, as a comma-separated MCP_SERVER_URLS;
+# defaults to MCP_SERVER_URL alone. Earlier servers win on tool name clashes.
+mcp_server_urls = [
+    url.strip() for url in os.getenv("MCP_SERVER_URLS", "").split(",") if url.strip()
+] or [mcp_server_url]
+
+# MCP SSE transport timeouts (seconds): HTTP operations, and waiting for the
+# next event on the SSE stream
+mcp_sse_timeout = float(os.getenv("MCP_SSE_TIMEOUT", "30"))
+mcp_sse_read_timeout = float(os.getenv("MCP_SSE_READ_TIMEOUT", "300"))
+
+# Seconds an MCP server's tool list is reused before it is fetched again
+mcp_tools_cache_ttl = float(os.getenv("MCP_TOOLS_CACHE_TTL", "300"))
+
+# Maximum number of MCP tool calls executed concurrently per process
+mcp_max_concurrency = int(os.getenv("MCP_MAX_CONCURRENCY", "8"))
+
+# Shared outbound HTTP connection pool used by the bot's async Azure clients.
+# Keep-alive is long enough for connections to survive idle time between turns.
+http_connection_limit = int(os.getenv("HTTP_CONNECTION_LIMIT", "100"))
+http_keepalive_timeout = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "120"))
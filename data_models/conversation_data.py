@@ -1,5 +1,3 @@
-from openai import AzureOpenAI
-
 class ConversationData:
     def __init__(
         self,
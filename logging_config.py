@@ -3,16 +3,26 @@ Configure logging for the application to control verbosity levels
 and direct all logs to Azure Application Insights
 """
 import logging
-from opencensus.ext.azure.log_exporter import AzureLogHandler
 import config
 
+# Set once logging has been configured; later calls are no-ops
+_configured = False
+
 def configure_logging():
     """
     Configure logging levels for different components of the application.
     Redirects all logs to Azure Application Insights instead of console.
     Specifically reduces the verbosity of Azure SDK HTTP logging.
+    Only the first call has an effect, so handlers are installed exactly once.
     """
+    global _configured
+    if _configured:
+        return
+    _configured = True
 
+    # Imported here so modules that only import this one don't load the
+    # opencensus exporter dependency tree
+    from opencensus.ext.azure.log_exporter import AzureLogHandler
     
     # Create formatter for consistent log format
     formatter = logging.Formatter(
@@ -20,8 +30,15 @@ def configure_logging():
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     
-    # Create Azure Application Insights handler
-    ai_handler = AzureLogHandler(connection_string=config.az_application_insights_key)
+    # Create Azure Application Insights handler. Records are queued and sent
+    # in batches by the handler's worker thread, off the request path
+    ai_handler = AzureLogHandler(
+        connection_string=config.az_application_insights_key,
+        export_interval=config.app_insights_export_interval,
+        max_batch_size=config.app_insights_max_batch_size,
+        queue_capacity=config.app_insights_queue_capacity,
+        grace_period=config.app_insights_grace_period,
+    )
     ai_handler.setFormatter(formatter)
       # Configure root logger with the Azure App Insights handler
     root_logger = logging.getLogger()
@@ -49,6 +66,12 @@ def configure_logging():
     # Set other Azure components to WARNING level
     logging.getLogger('azure').setLevel(logging.WARNING)
     
+    # Keep the exporter's own messages (e.g. failed sends) on the console
+    # instead of feeding them back into Application Insights
+    opencensus_logger = logging.getLogger('opencensus')
+    opencensus_logger.addHandler(console_handler)
+    opencensus_logger.propagate = False
+    
     # Set application loggers to appropriate levels
     logging.getLogger('__main__').setLevel(logging.INFO)
     logging.getLogger('bots').setLevel(logging.INFO)
@@ -3,21 +3,17 @@ MCP Direct Handler - Provides direct access to MCP server functions bypassing Py
 """
 
 import os
-import json
 import logging
+import orjson
 import asyncio
 import nest_asyncio
-from client import ServerConnection
-from logging_config import configure_logging
-import config
+from client import execute_pooled_tool
+from mcp_tools import get_mcp_server_url, unwrap_kwargs
 
 # Apply nest_asyncio to allow nested event loops
 nest_asyncio.apply()
 
-# Configure logging - this will set up all loggers to use Azure Application Insights
-configure_logging()
-
-# Get logger for this module - already configured by configure_logging()
+# Get logger for this module - configured by the application entry point
 logger = logging.getLogger(__name__)
 
 # This function can be called directly to execute an MCP tool without going through the Python callable
@@ -32,35 +28,21 @@ async def execute_mcp_tool_directly(function_name, arguments):
     Returns:
         The result of the tool execution
     """
-    logger.info(f"Direct MCP Tool Execution for '{function_name}' with arguments: {arguments}")
+    logger.info(
+        "Direct MCP Tool Execution for '%s' with arguments: %s", function_name, arguments
+    )
     
     # Process arguments in case they are wrapped in a kwargs structure
-    args_to_use = {}
-    if isinstance(arguments, dict):
-        if "kwargs" in arguments:
-            if isinstance(arguments["kwargs"], str):
-                if arguments["kwargs"] == "":
-                    args_to_use = {}
-                else:
-                    try:
-                        args_to_use = json.loads(arguments["kwargs"])
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse kwargs as JSON: {arguments['kwargs']}")
-                        args_to_use = {"value": arguments["kwargs"]}
-            else:
-                args_to_use = arguments["kwargs"]
-        else:
-            args_to_use = arguments
+    args_to_use = unwrap_kwargs(arguments)
     
-    logger.info(f"Processed arguments for MCP call: {args_to_use}")
+    logger.info("Processed arguments for MCP call: %s", args_to_use)
     
-    # Connect to MCP server and execute the tool
-    conn = ServerConnection(config.mcp_server_url)
-    await conn.connect()
-    result = await conn.execute_tool(function_name, args_to_use)
-    await conn.cleanup()
+    # Execute the tool over the pooled MCP server connection
+    result = await execute_pooled_tool(
+        get_mcp_server_url(function_name), function_name, args_to_use
+    )
     
-    logger.info(f"MCP tool '{function_name}' result: {result}")
+    logger.info("MCP tool '%s' result: %s", function_name, result)
     return result
 
 # This is a wrapper that can be called from non-async code
@@ -77,6 +59,6 @@ async def execute_mcp_tool_async(function_name, arguments):
     """
     result = await execute_mcp_tool_directly(function_name, arguments)
     if isinstance(result, dict):
-        return json.dumps(result)
+        return orjson.dumps(result).decode()
     return str(result)
 
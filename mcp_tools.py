@@ -5,50 +5,107 @@ MCP tools wrapper for creating callable functions from MCP tools.
 import os
 import json
 import logging
-import asyncio
-from client import ServerConnection
-from logging_config import configure_logging
+import orjson
+from client import MCPHost, execute_pooled_tool, run_coroutine_sync
 import config
 
-# Configure logging - this will set up all loggers to use Azure Application Insights
-configure_logging()
-
-# Get logger for this module - already configured by configure_logging()
+# Get logger for this module - configured by the application entry point
 logger = logging.getLogger(__name__)
 
-def create_mcp_functions():
+def unwrap_kwargs(arguments):
     """
-    Creates Python functions for each MCP tool available in the server.
+    Unwrap tool arguments sent in the Azure AI Agent Service kwargs format.
     
+    The agent may pass arguments flat, as {"kwargs": {...}} or as
+    {"kwargs": "<json>"}, possibly nested. Flat arguments are returned as is.
+    
+    Args:
+        arguments (dict): Arguments received for a tool call
+        
     Returns:
-        list: List of Python callable functions for MCP tools.
+        dict: The flat arguments to pass to the MCP tool
+    """
+    if not isinstance(arguments, dict):
+        return {}
+    while isinstance(arguments, dict) and "kwargs" in arguments:
+        nested = arguments["kwargs"]
+        if not isinstance(nested, str):
+            arguments = nested
+            continue
+        logger.info("Found nested kwargs structure: %s", arguments)
+        if nested == "":
+            return {}
+        try:
+            arguments = json.loads(nested)
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse kwargs as JSON: %s", nested)
+            return {"value": nested}
+    return arguments
+
+
+def fetch_mcp_tools():
+    """
+    Fetch the tools of every configured MCP server and record which server
+    provides each one, for get_mcp_server_url and is_mcp_function.
+    
+    Returns:
+        list: Tool descriptions, with tools shadowed by an earlier server dropped.
     """
 
-    logger.info(f"Connecting to MCP server at: {config.mcp_server_url}")
+    server_urls = config.mcp_server_urls
+    logger.info("Connecting to MCP server(s) at: %s", server_urls)
     
-    # Get tools from MCP server
+    # Get tools from all MCP servers concurrently
     async def fetch_tools():
-        conn = ServerConnection(config.mcp_server_url)
-        await conn.connect()
-        tools = await conn.list_tools()
-        await conn.cleanup()
-        return tools
+        host = MCPHost(server_urls)
+        await host.connect_all()
+        return await host.list_all_tools()
     
     # Store tool names globally for reference
     create_mcp_functions.mcp_tool_names = []
+    create_mcp_functions.mcp_tool_name_set = frozenset()
+    create_mcp_functions.mcp_tool_servers = {}
     
+    tools = []
     try:
-        tools = asyncio.run(fetch_tools())
+        # The pooled connections stay open on the background loop, where the
+        # tool functions run
+        server_tools = run_coroutine_sync(fetch_tools())
+        for server_url in server_urls:
+            for tool in server_tools.get(server_url, []):
+                if tool["name"] in create_mcp_functions.mcp_tool_servers:
+                    logger.warning(
+                        "Tool '%s' on %s is shadowed by the same tool on %s",
+                        tool["name"], server_url,
+                        create_mcp_functions.mcp_tool_servers[tool["name"]],
+                    )
+                    continue
+                create_mcp_functions.mcp_tool_servers[tool["name"]] = server_url
+                tools.append(tool)
         # Extract just the names for easy reference
         create_mcp_functions.mcp_tool_names = [tool['name'] for tool in tools]
+        create_mcp_functions.mcp_tool_name_set = frozenset(create_mcp_functions.mcp_tool_names)
     except Exception as e:
-        logger.error(f"Error fetching MCP tools: {e}")
+        logger.error("Error fetching MCP tools: %s", e)
         tools = []
-    logger.info(f"Found {len(tools)} MCP tools: {[tool['name'] for tool in tools]}")
+    logger.info(
+        "Found %d MCP tools: %s", len(tools), create_mcp_functions.mcp_tool_names
+    )
+    return tools
+
+
+def create_mcp_functions():
+    """
+    Creates Python functions for each MCP tool available in the server(s).
+    
+    Returns:
+        list: List of Python callable functions for MCP tools.
+    """
+    tools = fetch_mcp_tools()
     
     # Log the full schema of each tool for debugging
     for tool in tools:
-        logger.info(f"Tool schema for '{tool['name']}': {json.dumps(tool)}")
+        logger.info("Tool schema for '%s': %s", tool["name"], tool)
     
     # Create a function for each tool
     mcp_functions = []
@@ -59,50 +116,29 @@ def create_mcp_functions():
         def make_func(name=tool_name):
             def tool_func(kwargs=None, **args):
                 # Extra logging for debugging
-                logger.info(f"Tool '{name}' function called with: kwargs={kwargs}, args={args}")
+                logger.info(
+                    "Tool '%s' function called with: kwargs=%s, args=%s", name, kwargs, args
+                )
                 
-                # Handle both direct arguments and kwargs dict
-                if kwargs is not None and isinstance(kwargs, str):
+                if isinstance(kwargs, str):
                     # It is a string, not a dict
-                    logger.warning(f"Received kwargs as string: {kwargs}")
-                    if kwargs == "":
-                        args_to_use = {}
-                    else:
-                        try:
-                            args_to_use = json.loads(kwargs)
-                        except json.JSONDecodeError:
-                            args_to_use = {"value": kwargs}
-                elif kwargs is not None:
-                    args_to_use = kwargs
-                else:
-                    args_to_use = args
-                    
-                # Special handling for Azure AI Agent Service format
-                if isinstance(args_to_use, dict) and "kwargs" in args_to_use:
-                    if isinstance(args_to_use["kwargs"], str):
-                        logger.info(f"Found nested kwargs structure: {args_to_use}")
-                        if args_to_use["kwargs"] == "":
-                            args_to_use = {}
-                        else:
-                            try:
-                                args_to_use = json.loads(args_to_use["kwargs"])
-                            except (json.JSONDecodeError, TypeError):
-                                # Keep as is if not valid JSON
-                                pass
+                    logger.warning("Received kwargs as string: %s", kwargs)
+                args_to_use = unwrap_kwargs(args if kwargs is None else {"kwargs": kwargs})
                 
-                logger.info(f"Executing MCP tool '{name}' with args: {args_to_use}")
+                logger.info("Executing MCP tool '%s' with args: %s", name, args_to_use)
                 
                 async def call_tool():
-                    conn = ServerConnection(config.mcp_server_url)
-                    await conn.connect()
-                    result = await conn.execute_tool(name, args_to_use)
-                    logger.info(f"MCP tool '{name}' result: {result}")
-                    await conn.cleanup()
+                    result = await execute_pooled_tool(
+                        get_mcp_server_url(name), name, args_to_use
+                    )
+                    logger.info("MCP tool '%s' result: %s", name, result)
                     if isinstance(result, dict):
-                        return json.dumps(result)
+                        return orjson.dumps(result).decode()
                     return result
                     
-                return asyncio.run(call_tool())
+                # Run on the shared background loop, where the pooled connection
+                # persists between calls, instead of a new loop per call
+                return run_coroutine_sync(call_tool())
             
             # Set function name to match tool name
             tool_func.__name__ = name
@@ -112,6 +148,18 @@ def create_mcp_functions():
     
     return mcp_functions
 
+def get_mcp_server_url(name):
+    """
+    Get the URL of the MCP server that provides a tool.
+    
+    Args:
+        name (str): Tool name
+        
+    Returns:
+        str: The tool's server URL, or the first configured server if unknown
+    """
+    return create_mcp_functions.mcp_tool_servers.get(name, config.mcp_server_urls[0])
+
 def is_mcp_function(name):
     """
     Check if a function name is an MCP function.
@@ -122,7 +170,9 @@ def is_mcp_function(name):
     Returns:
         bool: True if it's an MCP function, False otherwise
     """
-    return name in create_mcp_functions.mcp_tool_names
+    return name in create_mcp_functions.mcp_tool_name_set
 
 # Expose this helper function
 create_mcp_functions.mcp_tool_names = []
+create_mcp_functions.mcp_tool_name_set = frozenset()
+create_mcp_functions.mcp_tool_servers = {}